@@ -0,0 +1,177 @@
+/* Optional C fast path for word-gen.py.
+ *
+ * Build in place:
+ *     python3 setup.py build_ext --inplace
+ *
+ * Exposes generate(pools, suffixes, fd, limit=0) -> emitted count.
+ * pools is a list of bytes (per-position option pools), suffixes a list
+ * of bytes appended to every base variant (or None).  Runs the same
+ * odometer as iter_base_variants but in C, formatting lines into a 1 MiB
+ * buffer flushed with write(2).
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <errno.h>
+#include <string.h>
+#include <unistd.h>
+
+#define BUF_SIZE (1 << 20)
+#define MAX_POSITIONS 256
+
+static int
+flush_buf(int fd, char *buf, size_t *used)
+{
+    size_t off = 0;
+
+    while (off < *used) {
+        ssize_t n = write(fd, buf + off, *used - off);
+        if (n < 0) {
+            if (errno == EINTR)
+                continue;
+            return -1;
+        }
+        off += (size_t)n;
+    }
+    *used = 0;
+    return 0;
+}
+
+static PyObject *
+wordgen_generate(PyObject *self, PyObject *args)
+{
+    PyObject *pools, *suffixes = Py_None;
+    int fd;
+    long long limit = 0, emitted = 0;
+    const char *pool[MAX_POSITIONS];
+    Py_ssize_t pool_len[MAX_POSITIONS];
+    Py_ssize_t idx[MAX_POSITIONS];
+    const char **suf = NULL;
+    Py_ssize_t *suf_len = NULL;
+    Py_ssize_t npos, nsuf = 0, i, j;
+    char base[MAX_POSITIONS];
+    char *buf = NULL;
+    size_t used = 0;
+    int io_error = 0, done = 0;
+
+    if (!PyArg_ParseTuple(args, "O!Oi|L", &PyList_Type, &pools, &suffixes,
+                          &fd, &limit))
+        return NULL;
+
+    npos = PyList_GET_SIZE(pools);
+    if (npos == 0 || npos > MAX_POSITIONS) {
+        PyErr_SetString(PyExc_ValueError, "pools must have 1..256 positions");
+        return NULL;
+    }
+    for (i = 0; i < npos; i++) {
+        PyObject *item = PyList_GET_ITEM(pools, i);
+        if (!PyBytes_Check(item) || PyBytes_GET_SIZE(item) == 0) {
+            PyErr_SetString(PyExc_TypeError, "pools must be non-empty bytes");
+            return NULL;
+        }
+        pool[i] = PyBytes_AS_STRING(item);
+        pool_len[i] = PyBytes_GET_SIZE(item);
+        idx[i] = 0;
+        base[i] = pool[i][0];
+    }
+
+    if (suffixes != Py_None) {
+        if (!PyList_Check(suffixes)) {
+            PyErr_SetString(PyExc_TypeError, "suffixes must be a list or None");
+            return NULL;
+        }
+        nsuf = PyList_GET_SIZE(suffixes);
+        suf = PyMem_Malloc((size_t)(nsuf ? nsuf : 1) * sizeof(*suf));
+        suf_len = PyMem_Malloc((size_t)(nsuf ? nsuf : 1) * sizeof(*suf_len));
+        if (!suf || !suf_len) {
+            PyMem_Free(suf);
+            PyMem_Free(suf_len);
+            return PyErr_NoMemory();
+        }
+        for (j = 0; j < nsuf; j++) {
+            PyObject *item = PyList_GET_ITEM(suffixes, j);
+            if (!PyBytes_Check(item) ||
+                PyBytes_GET_SIZE(item) > BUF_SIZE - MAX_POSITIONS - 1) {
+                PyMem_Free(suf);
+                PyMem_Free(suf_len);
+                PyErr_SetString(PyExc_TypeError, "suffixes must be short bytes");
+                return NULL;
+            }
+            suf[j] = PyBytes_AS_STRING(item);
+            suf_len[j] = PyBytes_GET_SIZE(item);
+        }
+    }
+
+    buf = PyMem_Malloc(BUF_SIZE);
+    if (!buf) {
+        PyMem_Free(suf);
+        PyMem_Free(suf_len);
+        return PyErr_NoMemory();
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    while (!done && !io_error) {
+        /* base variant alone, then base + each suffix */
+        for (j = -1; j < nsuf; j++) {
+            size_t line_len = (size_t)npos + 1;
+
+            if (j >= 0)
+                line_len += (size_t)suf_len[j];
+            if (used + line_len > BUF_SIZE && flush_buf(fd, buf, &used) < 0) {
+                io_error = 1;
+                break;
+            }
+            memcpy(buf + used, base, (size_t)npos);
+            used += (size_t)npos;
+            if (j >= 0) {
+                memcpy(buf + used, suf[j], (size_t)suf_len[j]);
+                used += (size_t)suf_len[j];
+            }
+            buf[used++] = '\n';
+            emitted++;
+            if (limit && emitted >= limit) {
+                done = 1;
+                break;
+            }
+        }
+        /* odometer increment over the base positions */
+        for (i = npos - 1; i >= 0; i--) {
+            if (++idx[i] < pool_len[i]) {
+                base[i] = pool[i][idx[i]];
+                break;
+            }
+            idx[i] = 0;
+            base[i] = pool[i][0];
+        }
+        if (i < 0)
+            done = 1;
+    }
+    if (!io_error && flush_buf(fd, buf, &used) < 0)
+        io_error = 1;
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(buf);
+    PyMem_Free(suf);
+    PyMem_Free(suf_len);
+    if (io_error)
+        return PyErr_SetFromErrno(PyExc_OSError);
+    return PyLong_FromLongLong(emitted);
+}
+
+static PyMethodDef wordgen_methods[] = {
+    {"generate", wordgen_generate, METH_VARARGS,
+     "generate(pools, suffixes, fd, limit=0) -> int\n"
+     "Write every base variant (and base+suffix) as one line to fd."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef wordgen_module = {
+    PyModuleDef_HEAD_INIT, "_wordgen", "C fast path for word-gen.py", -1,
+    wordgen_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__wordgen(void)
+{
+    return PyModule_Create(&wordgen_module);
+}
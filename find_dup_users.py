@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Find usernames that appear more than THRESHOLD times in a user:pass dump.
+
+Usage:
+    find_dup_users.py dump.txt
+"""
+
+import mmap
+import os
+import sys
+from collections import Counter
+from itertools import takewhile
+
+THRESHOLD = 3
+
+
+def find_frequent_users(filename, threshold=THRESHOLD):
+    """Return [(user, count)] for users seen more than threshold times,
+    most frequent first."""
+    user_counts = Counter()
+    # count on raw bytes: skips the per-line UTF-8 decode, and Counter
+    # hashes bytes just as fast as str; decode only the few winners
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            user_counts.update(
+                line.strip().partition(b":")[0]
+                for line in bytes(mm).split(b"\n")
+                if b":" in line
+            )
+    # most_common() is sorted, so stop at the first count <= threshold
+    # instead of scanning every unique user (most occur exactly once)
+    return [
+        (user.decode("utf-8", errors="replace"), count)
+        for user, count in takewhile(
+            lambda item: item[1] > threshold, user_counts.most_common()
+        )
+    ]
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("usage: find_dup_users.py FILE")
+    frequent = find_frequent_users(sys.argv[1])
+    if not frequent:
+        print("no duplicate users found")
+        return
+    for user, count in frequent:
+        print("%s: %d" % (user, count))
+
+
+if __name__ == "__main__":
+    main()
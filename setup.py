@@ -0,0 +1,14 @@
+"""Build the optional _wordgen C extension for word-gen.py:
+
+    python3 setup.py build_ext --inplace
+
+word-gen.py falls back to pure Python when the module is missing.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    name="wordgen-ext",
+    version="0.1",
+    ext_modules=[Extension("_wordgen", ["_wordgen.c"])],
+)
@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+"""Generate password wordlist variants: case flips, leet substitutions and
+optional digit/year suffixes.
+
+Examples:
+    word-gen.py password -o wordlist.txt --append-digits 4
+    word-gen.py admin --append-years 1990 2026 | head
+"""
+
+import argparse
+import itertools
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import _wordgen  # optional C fast path, see setup.py
+except ImportError:
+    _wordgen = None
+
+try:
+    import numpy as np  # optional vectorized path for large base products
+except ImportError:
+    np = None
+
+DEFAULT_SUBS = {
+    "a": ["a", "A", "@", "4"],
+    "b": ["b", "B", "8"],
+    "e": ["e", "E", "3"],
+    "g": ["g", "G", "9"],
+    "i": ["i", "I", "1", "!"],
+    "l": ["l", "L", "1", "|"],
+    "o": ["o", "O", "0"],
+    "s": ["s", "S", "5", "$"],
+    "t": ["t", "T", "7"],
+    "z": ["z", "Z", "2"],
+}
+
+DIGIT_SUFFIX_MAX_LEN = 4
+
+OUT_BUFFER_BYTES = 1 << 20
+
+FLUSH_BYTES = 4 << 20
+
+
+def _build_options(ch, subs):
+    lower = ch.lower()
+    if lower in subs:
+        candidates = [ch] + subs[lower]
+    elif ch.isalpha():
+        candidates = [ch.lower(), ch.upper()]
+    else:
+        candidates = [ch]
+    seen = set()
+    options = []
+    for cand in candidates:
+        if cand not in seen:
+            seen.add(cand)
+            options.append(cand.encode("ascii"))
+    return tuple(options)
+
+
+# per-codepoint option tuples, dedup'd once at import time so the per-call
+# path below is a single list index instead of branches plus a set
+_TABLE = tuple(_build_options(chr(cp), DEFAULT_SUBS) for cp in range(128))
+
+
+def options_for_char(ch, subs=DEFAULT_SUBS):
+    """All single-byte stand-ins for ch, original spelling first."""
+    cp = ord(ch)
+    if subs is DEFAULT_SUBS and cp < 128:
+        return _TABLE[cp]
+    return _build_options(ch, subs)
+
+
+def iter_base_variants_from_pools(pools, lo=0, hi=None):
+    """Odometer core: yield newline-terminated base variants lo..hi-1 from
+    prebuilt per-position pools.
+
+    One preallocated bytearray template (trailing newline included, so
+    the writer never concatenates); on each step only the columns whose
+    digit rolled over get patched.  No tuples, no str joins.
+    """
+    if hi is None:
+        hi = math.prod(len(pool) for pool in pools)
+    if not pools:
+        if lo < hi:
+            yield b"\n"
+        return
+    idx = unrank(lo, [len(pool) for pool in pools])
+    template = bytearray(len(pools) + 1)
+    for i, pool in enumerate(pools):
+        template[i] = pool[idx[i]]
+    template[-1] = 0x0A
+    last = len(pools) - 1
+    for _ in range(hi - lo):
+        yield bytes(template)
+        i = last
+        while i >= 0:
+            idx[i] += 1
+            if idx[i] < len(pools[i]):
+                template[i] = pools[i][idx[i]]
+                break
+            idx[i] = 0
+            template[i] = pools[i][0]
+            i -= 1
+
+
+def iter_base_variants(text, subs=DEFAULT_SUBS):
+    """Yield every substitution/case variant of text as newline-terminated
+    ASCII bytes."""
+    yield from iter_base_variants_from_pools(build_pools(text, subs))
+
+
+def iter_digit_suffixes(max_len=DIGIT_SUFFIX_MAX_LEN):
+    """Yield every digit string of length 1..max_len ("0" .. "9999")."""
+    for length in range(1, max_len + 1):
+        for combo in itertools.product("0123456789", repeat=length):
+            yield "".join(combo)
+
+
+def iter_year_suffixes(start, end):
+    for year in range(start, end + 1):
+        yield str(year)
+
+
+def iter_variants(
+    text,
+    subs=DEFAULT_SUBS,
+    append_digits=0,
+    years=None,
+    dedupe=False,
+    offset=0,
+    pools=None,
+):
+    """Yield every variant as a newline-terminated bytes line.
+
+    Suffix runs fuse base and suffix expansion into one flat odometer:
+    the newline-terminated tails act as a virtual rightmost position
+    (index 0 is the bare base line), so there is a single loop instead
+    of nested base/suffix generators, and offset/unrank address the
+    fused index space directly.
+    """
+    # build the suffix pools once up front; regenerating 11k digit strings
+    # per base variant used to dominate large runs
+    suffixes = build_suffixes(append_digits, years, dedupe)
+    if pools is None:
+        pools = build_pools(text, subs)
+    if suffixes is None:
+        base_total = math.prod(len(pool) for pool in pools)
+        if offset >= base_total:
+            return
+        yield from iter_base_variants_from_pools(pools, offset, base_total)
+        return
+    tails = [b"\n"] + [suffix + b"\n" for suffix in suffixes]
+    lens = [len(pool) for pool in pools] + [len(tails)]
+    if offset >= math.prod(lens):
+        return
+    idx = unrank(offset, lens)
+    j = idx.pop()  # the suffix position, fastest-moving
+    template = bytearray(len(pools))
+    for i, pool in enumerate(pools):
+        template[i] = pool[idx[i]]
+    base = bytes(template)
+    last = len(pools) - 1
+    ntails = len(tails)
+    while True:
+        yield base + tails[j]
+        j += 1
+        if j < ntails:
+            continue
+        j = 0
+        i = last
+        while i >= 0:
+            idx[i] += 1
+            if idx[i] < lens[i]:
+                template[i] = pools[i][idx[i]]
+                break
+            idx[i] = 0
+            template[i] = pools[i][0]
+            i -= 1
+        else:
+            return
+        base = bytes(template)
+
+
+def unrank(n, lens):
+    """Mixed-radix decode: per-position indices of the n-th combination
+    (rightmost position fastest), in O(len(lens)) integer ops."""
+    idx = [0] * len(lens)
+    for i in range(len(lens) - 1, -1, -1):
+        n, idx[i] = divmod(n, lens[i])
+    return idx
+
+
+def _shard_worker(job):
+    """Write one contiguous slice of base variants (plus suffixes) to a file."""
+    word, append_digits, years, dedupe, lo, hi, path, buffer_bytes = job
+    suffixes = [s + b"\n" for s in build_suffixes(append_digits, years, dedupe) or ()]
+    emitted = 0
+    with open(path, "wb", buffering=OUT_BUFFER_BYTES) as out:
+        buf = bytearray()
+        for line in iter_base_variants_from_pools(build_pools(word), lo, hi):
+            buf += line
+            base = line[:-1]
+            for suffix in suffixes:
+                buf += base
+                buf += suffix
+            emitted += 1 + len(suffixes)
+            if len(buf) >= buffer_bytes:
+                out.write(buf)
+                buf.clear()
+        if buf:
+            out.write(buf)
+    return emitted
+
+
+def concat_shards(shard_paths, out_path):
+    """Concatenate shard files into out_path.
+
+    Uses os.sendfile where available so the copy stays inside the kernel
+    instead of bouncing through a userspace buffer; falls back to
+    shutil.copyfileobj on other platforms or if sendfile refuses the fds.
+    """
+    with open(out_path, "wb") as out:
+        for path in shard_paths:
+            with open(path, "rb") as inp:
+                offset = 0
+                if hasattr(os, "sendfile"):
+                    out.flush()
+                    size = os.fstat(inp.fileno()).st_size
+                    try:
+                        while offset < size:
+                            sent = os.sendfile(
+                                out.fileno(), inp.fileno(), offset, size - offset
+                            )
+                            if sent == 0:
+                                break
+                            offset += sent
+                        if offset >= size:
+                            continue
+                    except OSError:
+                        pass
+                inp.seek(offset)
+                shutil.copyfileobj(inp, out, length=OUT_BUFFER_BYTES)
+
+
+def run_sharded(args, jobs, pools):
+    """Split the base-variant index range across a process pool.
+
+    Each worker writes its slice to a temp file next to the output; the
+    shards are concatenated afterwards, so the result is byte-identical
+    to a single-process run.
+    """
+    base_total = math.prod(len(pool) for pool in pools)
+    jobs = min(jobs, base_total)
+    bounds = [base_total * k // jobs for k in range(jobs + 1)]
+    out_dir = os.path.dirname(os.path.abspath(args.out)) or "."
+    shard_paths = []
+    shard_jobs = []
+    for k in range(jobs):
+        fd, path = tempfile.mkstemp(prefix=".wordgen-shard-", dir=out_dir)
+        os.close(fd)
+        shard_paths.append(path)
+        shard_jobs.append(
+            (
+                args.word,
+                args.append_digits,
+                args.append_years,
+                args.dedupe,
+                bounds[k],
+                bounds[k + 1],
+                path,
+                max(args.buffer_bytes, 1),
+            )
+        )
+    try:
+        with multiprocessing.Pool(jobs) as pool:
+            emitted = sum(pool.map(_shard_worker, shard_jobs))
+        concat_shards(shard_paths, args.out)
+    finally:
+        for path in shard_paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    return emitted
+
+
+def write_variants_writev(pools, append_digits, years, dedupe, fd, progress=None):
+    """Suffix-mode file path using scatter-gather IO.
+
+    For each base the lines share two buffers: the base itself and the
+    newline-terminated suffix tails.  Hand os.writev an interleaved
+    [line, base, tail, base, tail, ...] iovec so the kernel gathers the
+    lines and Python never concatenates base + suffix at all.
+    """
+    tails = [s + b"\n" for s in build_suffixes(append_digits, years, dedupe)]
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, OSError, ValueError):
+        iov_max = 1024
+    # fixed interleave, rebuilt per base with two slice assignments
+    segs = [None] * (1 + 2 * len(tails))
+    segs[2::2] = tails
+    emitted = 0
+    for line in iter_base_variants_from_pools(pools):
+        segs[0] = line
+        segs[1::2] = [line[:-1]] * len(tails)
+        for k in range(0, len(segs), iov_max):
+            os.writev(fd, segs[k : k + iov_max])
+        emitted += 1 + len(tails)
+        if progress:
+            progress(emitted)
+    return emitted
+
+
+NUMPY_CHUNK = 1 << 20
+
+NUMBA_CHUNK_BYTES = 8 << 20
+
+_numba_emit = None
+
+
+def _have_numba():
+    import importlib.util
+
+    return importlib.util.find_spec("numba") is not None
+
+
+def _get_numba_emit():
+    """Compile (once) the kernel that interleaves base and suffix bytes."""
+    global _numba_emit
+    if _numba_emit is None:
+        from numba import njit  # imported lazily; compile cost paid once
+
+        @njit(cache=True)
+        def emit_all(bases, base_len, suffix_bytes, suffix_offsets, out):
+            pos = 0
+            for i in range(bases.shape[0]):
+                for k in range(base_len):
+                    out[pos] = bases[i, k]
+                    pos += 1
+                out[pos] = 10
+                pos += 1
+                for j in range(suffix_offsets.shape[0] - 1):
+                    for k in range(base_len):
+                        out[pos] = bases[i, k]
+                        pos += 1
+                    for k in range(suffix_offsets[j], suffix_offsets[j + 1]):
+                        out[pos] = suffix_bytes[k]
+                        pos += 1
+                    out[pos] = 10
+                    pos += 1
+            return pos
+
+        _numba_emit = emit_all
+    return _numba_emit
+
+
+def write_variants_numba(pools, suffixes, sink, progress=None):
+    """Suffix-mode fast path: NumPy gathers base-variant chunks, a Numba
+    kernel expands each chunk into newline-terminated base+suffix lines
+    in one uint8 buffer, written per chunk."""
+    emit_all = _get_numba_emit()
+    lens = [len(p) for p in pools]
+    base_total = 1
+    for n in lens:
+        base_total *= n
+    cols = [np.frombuffer(p, dtype=np.uint8) for p in pools]
+    width = len(pools)
+    suffix_bytes = np.frombuffer(b"".join(suffixes), dtype=np.uint8)
+    suffix_offsets = np.zeros(len(suffixes) + 1, dtype=np.int64)
+    suffix_offsets[1:] = np.cumsum([len(s) for s in suffixes])
+    per_base_bytes = (width + 1) * (len(suffixes) + 1) + int(suffix_offsets[-1])
+    chunk_bases = max(1, NUMBA_CHUNK_BYTES // per_base_bytes)
+    out = np.empty(chunk_bases * per_base_bytes, dtype=np.uint8)
+    done_bases = 0
+    while done_bases < base_total:
+        rows = min(chunk_bases, base_total - done_bases)
+        grid = np.unravel_index(np.arange(done_bases, done_bases + rows), lens)
+        bases = np.empty((rows, width), dtype=np.uint8)
+        for i, col in enumerate(cols):
+            bases[:, i] = col[grid[i]]
+        n_bytes = emit_all(bases, width, suffix_bytes, suffix_offsets, out)
+        sink.write(out[:n_bytes])
+        done_bases += rows
+        if progress:
+            progress(done_bases * (len(suffixes) + 1))
+    return base_total * (len(suffixes) + 1)
+
+
+def write_base_variants_numpy(pools, sink, limit=0, progress=None, start=0):
+    """Write every base variant, newline-terminated, via NumPy gather ops.
+
+    Builds the Cartesian index grid in slabs of NUMPY_CHUNK rows with
+    np.unravel_index, gathers pool bytes into one (rows, len+1) uint8
+    matrix per slab and hands the whole slab to the sink in one write.
+    """
+    lens = [len(p) for p in pools]
+    total = 1
+    for n in lens:
+        total *= n
+    total = max(total - start, 0)
+    if limit:
+        total = min(total, limit)
+    cols = [np.frombuffer(p, dtype=np.uint8) for p in pools]
+    width = len(pools) + 1
+    emitted = 0
+    while emitted < total:
+        rows = min(NUMPY_CHUNK, total - emitted)
+        grid = np.unravel_index(
+            np.arange(start + emitted, start + emitted + rows), lens
+        )
+        out = np.empty((rows, width), dtype=np.uint8)
+        for i, col in enumerate(cols):
+            out[:, i] = col[grid[i]]
+        out[:, -1] = 0x0A
+        sink.write(out)
+        emitted += rows
+        if progress:
+            progress(emitted)
+    return emitted
+
+
+def build_pools(text, subs=DEFAULT_SUBS):
+    """Per-position ASCII option pools, one bytes object per character."""
+    return [b"".join(options_for_char(ch, subs)) for ch in text]
+
+
+def build_suffixes(append_digits=0, years=None, dedupe=False):
+    """All suffixes appended to each base variant, as bytes, or None.
+
+    Duplicate variants can only come from duplicate suffixes (a year that
+    is also a digit suffix): the per-position pools are dedup'd, so two
+    distinct odometer states always differ in some column.  Dropping
+    repeated suffixes here is therefore an exact, full-output dedupe.
+    """
+    if not append_digits and not years:
+        return None
+    suffixes = []
+    if append_digits:
+        suffixes += [s.encode("ascii") for s in iter_digit_suffixes(append_digits)]
+    if years:
+        suffixes += [s.encode("ascii") for s in iter_year_suffixes(years[0], years[1])]
+    if dedupe:
+        suffixes = list(dict.fromkeys(suffixes))
+    return suffixes
+
+
+def count_total(pools, append_digits=0, years=None, dedupe=False):
+    per_base = 1 + len(build_suffixes(append_digits, years, dedupe) or ())
+    return math.prod(len(pool) for pool in pools) * per_base
+
+
+def render_progress(emitted, total, started):
+    elapsed = time.monotonic() - started
+    rate = emitted / elapsed if elapsed > 0 else 0.0
+    sys.stderr.write(
+        "\r%d/%d (%6.2f%%) %.0f/s" % (emitted, total, 100.0 * emitted / total, rate)
+    )
+    if sys.stderr.isatty():
+        sys.stderr.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate case/leet wordlist variants of a word."
+    )
+    parser.add_argument("word", help="base word to mutate")
+    parser.add_argument("-o", "--out", help="output file (default: stdout)")
+    parser.add_argument(
+        "--append-digits",
+        type=int,
+        default=0,
+        metavar="N",
+        choices=range(0, DIGIT_SUFFIX_MAX_LEN + 1),
+        help="also emit each variant with every 1..N digit suffix",
+    )
+    parser.add_argument(
+        "--append-years",
+        nargs=2,
+        type=int,
+        metavar=("FROM", "TO"),
+        help="also emit each variant with year suffixes FROM..TO",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=0, metavar="N", help="stop after N variants"
+    )
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        metavar="N",
+        help="skip the first N variants (resume an interrupted run)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="shard suffix runs with -o across N processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="drop duplicate variants (arise when year and digit suffixes overlap)",
+    )
+    parser.add_argument(
+        "--buffer-bytes",
+        type=int,
+        default=FLUSH_BYTES,
+        metavar="N",
+        help="flush output in chunks of N bytes (default 4 MiB)",
+    )
+    args = parser.parse_args()
+
+    if not args.word.isascii():
+        parser.error("word must be ASCII")
+    if args.append_years and args.append_years[0] > args.append_years[1]:
+        parser.error("--append-years FROM must be <= TO")
+    if args.offset < 0:
+        parser.error("--offset must be >= 0")
+
+    # build the option pools once; every path below (totals, C, NumPy,
+    # Numba, writev, generators) reuses them instead of re-walking subs
+    pools = build_pools(args.word, DEFAULT_SUBS)
+    total = count_total(pools, args.append_digits, args.append_years, args.dedupe)
+    total = max(total - args.offset, 0)
+    if args.limit:
+        total = min(total, args.limit)
+
+    # suffix runs are embarrassingly parallel over base variants: shard the
+    # base index range across processes, one temp file each, then concatenate
+    jobs = args.jobs or os.cpu_count() or 1
+    if (
+        args.out
+        and jobs > 1
+        and args.word
+        and not args.limit
+        and not args.offset
+        and (args.append_digits or args.append_years)
+    ):
+        emitted = run_sharded(args, jobs, pools)
+        sys.stderr.write("wrote %d variants to %s\n" % (emitted, args.out))
+        return
+
+    # 1 MiB buffer: default 8 KiB means a write(2) every ~8 KB of wordlist
+    if args.out:
+        sink = open(args.out, "wb", buffering=OUT_BUFFER_BYTES)
+    else:
+        # every path emits pre-chunked bytes, so write straight to the
+        # binary stdout buffer; text/extra buffering layers only add copies
+        sink = sys.stdout.buffer
+    started = time.monotonic()
+    emitted = 0
+    last_update = 0
+    try:
+        if _wordgen is not None and args.word and not args.offset:
+            sink.flush()
+            emitted = _wordgen.generate(
+                pools,
+                build_suffixes(args.append_digits, args.append_years, args.dedupe),
+                sink.fileno(),
+                args.limit,
+            )
+        elif (
+            np is not None
+            and args.word
+            and not args.limit
+            and not args.offset
+            and (args.append_digits or args.append_years)
+            and _have_numba()
+        ):
+
+            def progress(done):
+                nonlocal last_update
+                render_progress(done, total, started)
+                last_update = done
+
+            emitted = write_variants_numba(
+                pools,
+                build_suffixes(args.append_digits, args.append_years, args.dedupe),
+                sink,
+                progress if args.out else None,
+            )
+        elif (
+            args.out
+            and hasattr(os, "writev")
+            and args.word
+            and not args.limit
+            and not args.offset
+            and (args.append_digits or args.append_years)
+        ):
+            progress_step = max(1000, total // 200)
+            state = {"next": progress_step}
+
+            def progress(done):
+                nonlocal last_update
+                if done >= state["next"]:
+                    render_progress(done, total, started)
+                    last_update = done
+                    state["next"] = done + progress_step
+
+            sink.flush()
+            emitted = write_variants_writev(
+                pools,
+                args.append_digits,
+                args.append_years,
+                args.dedupe,
+                sink.fileno(),
+                progress,
+            )
+        elif (
+            np is not None
+            and args.word
+            and not args.append_digits
+            and not args.append_years
+        ):
+
+            def progress(done):
+                nonlocal last_update
+                render_progress(done, total, started)
+                last_update = done
+
+            emitted = write_base_variants_numpy(
+                pools,
+                sink,
+                args.limit,
+                progress if args.out else None,
+                args.offset,
+            )
+        else:
+            # batch variants into one buffer so each variant does not pay
+            # a Python-level sink.write() call
+            buf = bytearray()
+            flush_bytes = max(args.buffer_bytes, 1)
+            # render at most ~200 updates per run; a fixed 1000-item cadence
+            # meant thousands of stderr writes per second on fast paths
+            progress_step = max(1000, total // 200)
+            next_update = progress_step
+            for line in iter_variants(
+                args.word,
+                DEFAULT_SUBS,
+                args.append_digits,
+                args.append_years,
+                args.dedupe,
+                args.offset,
+                pools,
+            ):
+                buf += line
+                if len(buf) >= flush_bytes:
+                    sink.write(buf)
+                    buf.clear()
+                emitted += 1
+                if args.limit and emitted >= args.limit:
+                    break
+                if args.out and emitted >= next_update:
+                    render_progress(emitted, total, started)
+                    last_update = emitted
+                    next_update += progress_step
+            if buf:
+                sink.write(buf)
+    finally:
+        sink.flush()
+        if args.out:
+            sink.close()
+        if last_update:
+            sys.stderr.write("\n")
+    if args.out:
+        sys.stderr.write("wrote %d variants to %s\n" % (emitted, args.out))
+
+
+if __name__ == "__main__":
+    main()